@@ -13,6 +13,11 @@ class AquiferModel:
     wells: list = field(default_factory=list)
     boundaries: list = field(default_factory=list)
 
+    # Reused across solves so its cached factorization can be reused too
+    _steady_solver: SteadyStateSolver = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # -----------------------------------------------
     # Hydraulic property access
     # -----------------------------------------------
@@ -30,9 +35,10 @@ class AquiferModel:
     # -----------------------------------------------
     # Steady-state solver hook
     # -----------------------------------------------
-    def solve_steady_state(self, method="direct"):
-        solver = SteadyStateSolver()
-        result = solver.solve(self, method=method)
+    def solve_steady_state(self, method="direct", verbose=True):
+        if self._steady_solver is None:
+            self._steady_solver = SteadyStateSolver()
+        result = self._steady_solver.solve(self, method=method, verbose=verbose)
         self.last_solution = result
         return result
 
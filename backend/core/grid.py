@@ -8,6 +8,10 @@ class Grid:
     nlay: int = 1     # number of vertical layers
 
     def __post_init__(self):
+        # Contiguous float64 spacing (no copy if already in that form)
+        self.dx = np.ascontiguousarray(self.dx, dtype=np.float64)
+        self.dy = np.ascontiguousarray(self.dy, dtype=np.float64)
+
         self.nx = len(self.dx)
         self.ny = len(self.dy)
 
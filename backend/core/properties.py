@@ -26,6 +26,18 @@ class AquiferProperties:
     confined: bool = False
 
     def __post_init__(self):
+        # Solver kernels expect C-contiguous float64 arrays; this is a no-op
+        # (no copy) when the inputs already are
+        self.Kx = np.ascontiguousarray(self.Kx, dtype=np.float64)
+        self.Ky = np.ascontiguousarray(self.Ky, dtype=np.float64)
+        self.Kz = np.ascontiguousarray(self.Kz, dtype=np.float64)
+        self.thickness = np.ascontiguousarray(self.thickness, dtype=np.float64)
+
+        for name in ("Sy", "Ss", "porosity"):
+            value = getattr(self, name)
+            if value is not None:
+                setattr(self, name, np.ascontiguousarray(value, dtype=np.float64))
+
         self.nlay, self.nx, self.ny = self.Kx.shape
 
         if self.Ky.shape != (self.nlay, self.nx, self.ny):
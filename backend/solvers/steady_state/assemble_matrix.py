@@ -1,71 +1,123 @@
+from functools import lru_cache
+
 import numpy as np
-from scipy.sparse import lil_matrix
+from scipy.sparse import csr_matrix
 
 # ==============================================================================
-#  EXPAND LOCATION-BASED BOUNDARIES INTO CELL-BASED BOUNDARIES
+#  CONSTANT-HEAD BOUNDARIES
 # ==============================================================================
 
-def expand_location_boundaries(model):
+def constant_head_cells(model):
     """
-    Converts location-based constant-head boundaries like:
-        {"type": "CONSTANT_HEAD", "value": 100, "location": "LEFT"}
-    into explicit cell-index boundaries:
-        {"type": "CONSTANT_HEAD", "value": 100, "i": 0, "j": j}
+    Collect all constant-head cells of the model as flat arrays.
 
-    This allows simple model definitions while still giving the
-    solver explicit (i, j) coordinates for boundary conditions.
+    Supported cell specifications:
+        "location": LEFT/RIGHT/TOP/BOTTOM
+        "i", "j"  : one cell (ints) or many cells (index arrays)
+        "cells"   : array-like of (i, j) pairs, shape (n, 2)
+    Cells outside the grid are ignored. Where boundaries overlap (e.g.
+    grid corners) the first boundary listed wins.
 
     Returns:
-        List of BC dictionaries with explicit (i, j) coordinates.
+        rows   : flattened cell indices (row = j*nx + i), sorted, int32
+                 (int64 for grids too large for int32)
+        values : constant-head value of each cell
     """
 
     nx, ny = model.grid.nx, model.grid.ny
-    expanded = []
+    rows = []
+    values = []
 
-    for bc in model.boundaries:
+    # Consecutive single-cell boundaries are collected as plain ints and
+    # converted in one call, instead of building tiny arrays per cell
+    run_rows = []
+    run_values = []
 
-        # Keep non-constant-head boundaries unchanged
+    for bc in model.boundaries:
         if bc["type"] != "CONSTANT_HEAD":
-            expanded.append(bc)
             continue
 
-        # If (i, j) are already given → keep as is
-        if "i" in bc and "j" in bc:
-            expanded.append(bc)
-            continue
+        if "cells" in bc:
+            cells = np.asarray(bc["cells"], dtype=int).reshape(-1, 2)
+            i, j = _in_grid(cells[:, 0], cells[:, 1], nx, ny)
+        elif "i" in bc and "j" in bc:
+            i, j = bc["i"], bc["j"]
+            if isinstance(i, (int, np.integer)) and isinstance(j, (int, np.integer)):
+                # Cells outside the grid are ignored
+                if 0 <= i < nx and 0 <= j < ny:
+                    run_rows.append(j * nx + i)
+                    run_values.append(bc["value"])
+                continue
+            i, j = _in_grid(*np.broadcast_arrays(
+                np.asarray(i, dtype=int), np.asarray(j, dtype=int)
+            ), nx, ny)
+        else:
+            cells = _perimeter_cells(bc.get("location", "").upper(), nx, ny)
+            if cells is None:
+                continue
+            i, j = cells
 
-        # Interpret location keywords
-        location = bc.get("location", "").upper()
-        value = bc["value"]
+        if run_rows:
+            rows.append(np.array(run_rows))
+            values.append(np.array(run_values, dtype=float))
+            run_rows, run_values = [], []
 
-        if location == "LEFT":
-            for j in range(ny):
-                expanded.append({"type": "CONSTANT_HEAD", "value": value, "i": 0, "j": j})
+        rows.append((j * nx + i).ravel())
+        values.append(np.full(len(rows[-1]), bc["value"], dtype=float))
 
-        elif location == "RIGHT":
-            for j in range(ny):
-                expanded.append({"type": "CONSTANT_HEAD", "value": value, "i": nx - 1, "j": j})
+    if run_rows:
+        rows.append(np.array(run_rows))
+        values.append(np.array(run_values, dtype=float))
 
-        elif location == "TOP":
-            for i in range(nx):
-                expanded.append({"type": "CONSTANT_HEAD", "value": value, "i": i, "j": ny - 1})
+    if not rows:
+        return np.empty(0, dtype=np.int32), np.empty(0)
 
-        elif location == "BOTTOM":
-            for i in range(nx):
-                expanded.append({"type": "CONSTANT_HEAD", "value": value, "i": i, "j": 0})
+    rows, first = np.unique(np.concatenate(rows), return_index=True)
+
+    # int32 halves the index traffic of every fancy-indexed BC update
+    return rows.astype(_index_dtype(nx * ny)), np.concatenate(values)[first]
+
+
+def _in_grid(i, j, nx, ny):
+    """Keep only the (i, j) index pairs that lie inside an nx x ny grid."""
+    inside = (i >= 0) & (i < nx) & (j >= 0) & (j < ny)
+    return i[inside], j[inside]
+
+
+def _index_dtype(max_index):
+    """int32 when every index (and nnz) stays below 2**31, else int64."""
+    return np.int32 if max_index < 2**31 else np.int64
 
-        else:
-            # Unknown location → skip silently or raise
-            continue
 
-    return expanded
+@lru_cache(maxsize=64)
+def _perimeter_cells(location, nx, ny):
+    """
+    Return (i, j) index arrays of the cells along a grid edge, or None.
+
+    Results are memoized per (location, nx, ny), so every boundary on the
+    same edge (and every repeated solve) shares one read-only pair.
+    """
+    if location == "LEFT":
+        cells = np.zeros(ny, dtype=int), np.arange(ny)
+    elif location == "RIGHT":
+        cells = np.full(ny, nx - 1), np.arange(ny)
+    elif location == "TOP":
+        cells = np.arange(nx), np.full(nx, ny - 1)
+    elif location == "BOTTOM":
+        cells = np.arange(nx), np.zeros(nx, dtype=int)
+    else:
+        return None
+
+    for arr in cells:
+        arr.setflags(write=False)
+    return cells
 
 
 # ==============================================================================
 #  MATRIX ASSEMBLY
 # ==============================================================================
 
-def assemble_matrix(model, head_prev):
+def assemble_matrix(model, head_prev, b_out=None, sources=None, constant_heads=None):
     """
     Assemble the finite-difference matrix (A) and RHS vector (b)
     for confined or unconfined saturated groundwater flow.
@@ -73,6 +125,20 @@ def assemble_matrix(model, head_prev):
     Implements BCF-style unconfined correction:
         saturated_thickness = max(head - bottom, min_thick)
 
+    If b_out (length nx*ny) is given, the RHS is written into it in place
+    so callers can reuse one buffer across outer iterations.
+
+    If sources (from assemble_sources) is given, it is added to b instead
+    of re-evaluating every well.
+
+    If constant_heads (rows, values from constant_head_cells) is given, the
+    model boundaries are not re-classified; all constant-head rows are then
+    applied in one batch.
+
+    The 5-point stencil is assembled for the whole grid with NumPy (no
+    per-cell Python loop) directly into CSR arrays with int32 indices
+    (int64 when the grid is too large for int32).
+
     Returns:
         A (CSR sparse matrix)
         b (RHS vector)
@@ -87,149 +153,172 @@ def assemble_matrix(model, head_prev):
 
     assert nlay == 1, "Current implementation handles 1 layer only."
 
-    # Expand boundaries (location → per-cell)
-    boundaries = expand_location_boundaries(model)
-
     # Flattened system size
     N = nx * ny
 
-    # Sparse matrix and RHS vector
-    A = lil_matrix((N, N), dtype=float)
-    b = np.zeros(N)
+    # Constant-head cells (location → per-cell) as a lookup over rows
+    if constant_heads is None:
+        constant_heads = constant_head_cells(model)
+    ch_rows, ch_values = constant_heads
+    is_ch = np.zeros(N, dtype=bool)
+    is_ch[ch_rows] = True
+    ch_head = np.zeros(N)
+    ch_head[ch_rows] = ch_values
+
+    # RHS vector
+    if b_out is None:
+        b = np.zeros(N)
+    else:
+        b = b_out
+        b.fill(0.0)
 
     # ==============================================================================
     #  SATURATED THICKNESS (for unconfined flow)
     # ==============================================================================
-    thickness = np.zeros((nx, ny))
     base_thickness = props.thickness[0]
 
     if props.confined:
-        thickness[:, :] = base_thickness
+        thickness = np.full((nx, ny), base_thickness, dtype=float)
     else:
         # Unconfined BCF method
         bottom = np.zeros((nx, ny))           # Placeholder: no bottom elevations yet
         min_thick = 0.1
 
-        for i in range(nx):
-            for j in range(ny):
-                sat = max(head_prev[i, j] - bottom[i, j], min_thick)
-                thickness[i, j] = sat
+        thickness = np.maximum(head_prev - bottom, min_thick)
 
     # ==============================================================================
-    #  MAIN LOOP: Build A and b
+    #  FACE TRANSMISSIVITIES (harmonic, evaluated for the whole grid at once)
     # ==============================================================================
-    for j in range(ny):
-        for i in range(nx):
-
-            row = j * nx + i  # flatten 2D → 1D index
-
-            # ---------------------------------------------------------------
-            # CONSTANT HEAD BC
-            # ---------------------------------------------------------------
-            ch = _constant_head_value(boundaries, i, j)
-            if ch is not None:
-                A[row, row] = 1.0
-                b[row] = ch
-                continue
-
-            # ---------------------------------------------------------------
-            # TRANSMISSIVITY VALUES
-            # ---------------------------------------------------------------
-            Kx = props.Kx[0, i, j]
-            Ky = props.Ky[0, i, j]
-
-            # Own transmissivity
-            Tx = Kx * thickness[i, j]
-            Ty = Ky * thickness[i, j]
+    #   tx[i, j] : between (i, j) and (i+1, j)   shape (nx-1, ny)
+    #   ty[i, j] : between (i, j) and (i, j+1)   shape (nx, ny-1)
+    tx = _face_transmissivity(props.Kx[0] * thickness, axis=0)
+    ty = _face_transmissivity(props.Ky[0] * thickness, axis=1)
 
-            # Neighbor transmissivities (harmonic)
-            tx_w = _trans_x(model, thickness, i, j, i - 1, j)
-            tx_e = _trans_x(model, thickness, i, j, i + 1, j)
-            ty_s = _trans_y(model, thickness, i, j, i, j - 1)
-            ty_n = _trans_y(model, thickness, i, j, i, j + 1)
-
-            # Diagonal coefficient
-            A[row, row] = tx_w + tx_e + ty_s + ty_n
-
-            # West neighbor
-            if i > 0:
-                A[row, row - 1] = -tx_w
-
-            # East neighbor
-            if i < nx - 1:
-                A[row, row + 1] = -tx_e
-
-            # South neighbor
-            if j > 0:
-                A[row, row - nx] = -ty_s
-
-            # North neighbor
-            if j < ny - 1:
-                A[row, row + nx] = -ty_n
+    # ==============================================================================
+    #  STENCIL COEFFICIENTS: Build A and b for all cells at once
+    # ==============================================================================
+    # Conductance to each neighbor per cell (0 outside the grid), flattened
+    # in row order (row = j*nx + i, i.e. Fortran order of (nx, ny) arrays).
+    # Stored in Fortran order so every ravel below is a view, not a copy.
+    t_w = np.zeros((nx, ny), order="F")
+    t_e = np.zeros((nx, ny), order="F")
+    t_s = np.zeros((nx, ny), order="F")
+    t_n = np.zeros((nx, ny), order="F")
+    t_w[1:, :] = tx
+    t_e[:-1, :] = tx
+    t_s[:, 1:] = ty
+    t_n[:, :-1] = ty
+
+    # At most 5 entries per row, so 5*N bounds nnz for the index dtype
+    index_dtype = _index_dtype(5 * N)
+    rows = np.arange(N, dtype=index_dtype)
+    active = ~is_ch
+
+    # Diagonal coefficient (identity row for constant-head cells)
+    diag = t_w + t_e
+    diag += t_s
+    diag += t_n
+    diag = diag.ravel(order="F")
+    diag[is_ch] = 1.0
+
+    # Band layout of each CSR row, in increasing column order:
+    #   (south, west, diagonal, east, north)
+    offsets = np.array([-nx, -1, 0, 1, nx], dtype=index_dtype)
+    coef = np.zeros((N, 5))
+    present = np.zeros((N, 5), dtype=bool)
+
+    coef[:, 2] = diag
+    present[:, 2] = True
+
+    for k, t_dir in ((0, t_s), (1, t_w), (3, t_e), (4, t_n)):
+        t_flat = t_dir.ravel(order="F")
+        r = rows[active & (t_flat > 0)]
+        c = r + offsets[k]
+        t = t_flat[r]
+
+        # Known constant heads move to the RHS, keeping A symmetric
+        known = is_ch[c]
+        b[r[known]] += t[known] * ch_head[c[known]]
+
+        r = r[~known]
+        coef[r, k] = -t[~known]
+        present[r, k] = True
+
+    # CSR arrays straight from the band layout (rows in order, sorted columns)
+    indptr = np.zeros(N + 1, dtype=index_dtype)
+    np.cumsum(present.sum(axis=1), out=indptr[1:])
+    indices = (rows[:, None] + offsets)[present]
+    data = coef[present]
+
+    A = csr_matrix((data, indices, indptr), shape=(N, N))
 
     # ==============================================================================
     #  ADD WELLS
     # ==============================================================================
-    for well in model.wells:
-        q = well.get_rhs_contribution(nx, ny)
-        b += q
+    if sources is None:
+        assemble_sources(model, out=b)
+    else:
+        b += sources
 
-    return A.tocsr(), b, (nx, ny)
+    # Constant-head rows are set last, so a well placed in a constant-head
+    # cell cannot change that cell's head
+    b[is_ch] = ch_head[is_ch]
 
+    return A, b, (nx, ny)
 
-# ==============================================================================
-#  BOUNDARY HELPERS
-# ==============================================================================
 
-def _constant_head_value(boundaries, i, j):
-    """Return constant-head value at (i,j) or None."""
-    for bc in boundaries:
-        if bc["type"] == "CONSTANT_HEAD" and bc["i"] == i and bc["j"] == j:
-            return bc["value"]
-    return None
+_WELL_SPEC = np.dtype([("i", np.int32), ("j", np.int32), ("Q", np.float64)])
 
 
-# ==============================================================================
-#  TRANSMISSIVITY HELPERS
-# ==============================================================================
-
-def _trans_x(model, thickness, i, j, inbr, jnbr):
+def assemble_sources(model, out=None):
     """
-    Transmissivity between (i,j) and west/east neighbor.
-    Harmonic averaging recommended (USBR §5-14).
+    Build the RHS contribution of all wells (flattened, length nx*ny).
+
+    Well rates do not depend on head, so the solver computes this once
+    and passes it to every assemble_matrix call. All wells are scattered
+    in a single vectorized call (wells sharing a cell are summed).
     """
     nx, ny = model.grid.nx, model.grid.ny
-    if inbr < 0 or inbr >= nx:
-        return 0.0
+    q = np.zeros(nx * ny) if out is None else out
 
-    K1 = model.properties.Kx[0, i, j]
-    K2 = model.properties.Kx[0, inbr, j]
+    if not model.wells:
+        return q
 
-    t1 = thickness[i, j]
-    t2 = thickness[inbr, j]
+    for well in model.wells:
+        if well.cell_index is None:
+            raise RuntimeError(f"Well '{well.name}' is not assigned to a grid cell.")
 
-    if t1 <= 0 or t2 <= 0:
-        return 0.0
+    # One pass over the wells into contiguous (i, j, Q) columns
+    specs = np.fromiter(
+        ((*well.cell_index, well.rate) for well in model.wells),
+        dtype=_WELL_SPEC,
+        count=len(model.wells),
+    )
 
-    return 2.0 / (1.0/(K1 * t1) + 1.0/(K2 * t2))
+    # Linear index in intp: j*nx can exceed int32 on very large grids
+    np.add.at(q, specs["j"].astype(np.intp) * nx + specs["i"], specs["Q"])
 
+    return q
 
-def _trans_y(model, thickness, i, j, inbr, jnbr):
-    """
-    Transmissivity between (i,j) and south/north neighbor.
-    Harmonic averaging (Todd 2005; USBR Ground Water Manual).
-    """
-    nx, ny = model.grid.nx, model.grid.ny
-    if jnbr < 0 or jnbr >= ny:
-        return 0.0
 
-    K1 = model.properties.Ky[0, i, j]
-    K2 = model.properties.Ky[0, i, jnbr]
+# ==============================================================================
+#  TRANSMISSIVITY HELPERS
+# ==============================================================================
+
+def _face_transmissivity(T, axis):
+    """
+    Harmonic-mean transmissivity between neighboring cells along an axis.
+    Harmonic averaging recommended (USBR §5-14; Todd 2005).
 
-    t1 = thickness[i, j]
-    t2 = thickness[i, jnbr]
+    T is the cell transmissivity K * saturated thickness, shape (nx, ny).
+    Faces touching a cell with zero transmissivity get 0.
+    """
+    if axis == 0:
+        t1, t2 = T[:-1, :], T[1:, :]
+    else:
+        t1, t2 = T[:, :-1], T[:, 1:]
 
-    if t1 <= 0 or t2 <= 0:
-        return 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_face = 2.0 * t1 * t2 / (t1 + t2)
 
-    return 2.0 / (1.0/(K1 * t1) + 1.0/(K2 * t2))
+    return np.where((t1 > 0) & (t2 > 0), t_face, 0.0)
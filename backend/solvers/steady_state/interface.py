@@ -4,6 +4,7 @@ Unified interface for steady-state groundwater flow solvers.
 Provides:
  - Direct solver (LU)
  - SOR iterative solver
+ - Preconditioned conjugate gradient (CG) solver (Jacobi or ILU)
  - Unified result dictionary for AquiferModel and API
 
 References:
@@ -14,26 +15,52 @@ References:
 from __future__ import annotations
 import numpy as np
 
-from backend.solvers.steady_state.assemble_matrix import assemble_matrix
-from backend.solvers.steady_state.solver_direct import solve_direct
-from backend.solvers.steady_state.solver_iterative import solve_iterative
+from backend.solvers.steady_state.assemble_matrix import (
+    assemble_matrix,
+    assemble_sources,
+    constant_head_cells,
+)
+from backend.solvers.steady_state.solver_direct import factorize, solve_direct
+from backend.solvers.steady_state.solver_iterative import solve_iterative, solve_cg
 from backend.utils.logging import log_solver_start, log_solver_result
 
 
 class SteadyStateSolver:
     """
     High-level steady-state solver wrapper.
-    Supports: method = "direct" or "sor"
+    Supports: method = "direct", "sor" or "cg"
     """
 
+    # method name -> inner linear solver (resolved once per solve)
+    _METHODS = {
+        "direct": "_solve_direct",
+        "sor": "_solve_sor",
+        "cg": "_solve_cg",
+    }
+
+    def __init__(self, preconditioner: str = "jacobi"):
+        # CG preconditioner: "jacobi" or "ilu"
+        self.preconditioner = preconditioner
+
+        # Cached sparse LU of A for the direct method, and a copy of the
+        # CSR arrays it was computed from (to detect when A is unchanged).
+        # Only head-independent (confined) systems can be reused.
+        self._lu = None
+        self._lu_matrix = None
+
     # ------------------------------------------------------------------
     #  MAIN SOLVER ENTRY POINT
     # ------------------------------------------------------------------
-    def solve(self, model, method: str = "direct") -> dict:
+    def solve(self, model, method: str = "direct", verbose: bool = True) -> dict:
         """
         Solve the steady-state saturated flow equation using
         a matrix-based finite-difference approach.
 
+        If verbose is False, the start/result log lines are not printed.
+
+        "iterations" is the total number of inner (SOR/CG) iterations over
+        all outer passes, or None for the direct method.
+
         Returns:
             {
                 "converged": bool,
@@ -46,10 +73,13 @@ class SteadyStateSolver:
         """
 
         method = method.lower()
-        if method not in ("direct", "sor"):
+        if method not in self._METHODS:
             raise ValueError(f"Unknown solver method: {method}")
 
-        log_solver_start(f"Running steady-state solver ({method})")
+        inner_solve = getattr(self, self._METHODS[method])
+
+        if verbose:
+            log_solver_start(f"Running steady-state solver ({method})")
 
         # Initial head guess based on average constant-head BCs
         nx, ny = model.grid.nx, model.grid.ny
@@ -63,54 +93,84 @@ class SteadyStateSolver:
         notes = ""
         residual = 0.0
 
+        # RHS buffer reused by every assembly of the outer loop, and a
+        # scratch array for the outer convergence check
+        b_buf = np.empty(nx * ny)
+        delta = np.empty((nx, ny))
+
+        # Confined transmissivity does not depend on head, so A is the same
+        # on every outer iteration: assemble it only once. Such a matrix can
+        # also repeat across solve() calls, so its LU is worth caching;
+        # unconfined matrices change every pass and are never compared.
+        head_independent = bool(model.properties.confined)
+
+        # Well rates are head-independent: evaluate them once
+        sources = assemble_sources(model)
+        sources.setflags(write=False)
+
+        # Boundaries are classified once into flat constant-head arrays
+        constant_heads = constant_head_cells(model)
+
+        if head_independent:
+            A, b, grid_shape = assemble_matrix(
+                model, head_prev, b_out=b_buf, sources=sources,
+                constant_heads=constant_heads,
+            )
+
         # ==================================================================
         #  OUTER LOOP — FOR UNCONFINED ITERATION (BCF METHOD)
         # ==================================================================
         for outer in range(max_outer_iter):
 
             # Assemble matrix using current head estimate
-            A, b, grid_shape = assemble_matrix(model, head_prev)
+            if not head_independent:
+                A, b, grid_shape = assemble_matrix(
+                    model, head_prev, b_out=b_buf, sources=sources,
+                    constant_heads=constant_heads,
+                )
             nx, ny = grid_shape
 
             # --------------------------------------------------------------
-            # SELECT NUMERICAL SOLVER
+            # NUMERICAL SOLVER (selected above)
             # --------------------------------------------------------------
-            if method == "direct":
-                # Direct solver returns a full (nx, ny) head array
-                head_new = solve_direct(A, b, nx, ny)
-                residual = 0.0
-                iterations = None
-                converged_inner = True
-                notes = "Direct LU decomposition completed."
-
-            else:  # SOR iterative solver
-                # solve_iterative returns (head_2D, iterations, converged)
-                head_new, iterations, converged_inner = solve_iterative(
-                    A, b, nx, ny
-                )
+            head_new, inner_iters, converged_inner, notes = inner_solve(
+                A, b, nx, ny, head_prev, head_independent
+            )
 
-                # compute a residual for reporting
-                residual = np.linalg.norm(A @ head_new.flatten() - b)
+            # Report the inner iterations of all outer passes together
+            if inner_iters is not None:
+                iterations = (iterations or 0) + inner_iters
 
-                notes = "SOR iteration completed."
+            if head_independent:
+                # A and b do not depend on head: one linear solve is final
+                converged = converged_inner
+                head_final = head_new
+                break
 
             # --------------------------------------------------------------
             # OUTER LOOP CONVERGENCE CHECK (BCF method)
             # --------------------------------------------------------------
-            diff = np.max(np.abs(head_new - head_prev))
+            # max |head_new - head_prev| without allocating temporaries
+            np.subtract(head_new, head_prev, out=delta)
+            diff = np.abs(delta, out=delta).max()
 
             if diff < tol_outer:
                 converged = True
                 head_final = head_new
                 break
 
-            head_prev = head_new.copy()
+            # Solvers return a fresh array each pass, so no copy is needed
+            head_prev = head_new
 
         else:
             # OUTER LOOP DID NOT CONVERGE
             converged = False
             head_final = head_new
 
+        # Residual of the final iterate only (the direct solve is exact)
+        if method != "direct":
+            residual = self._residual(A, b, head_final)
+
         # ==================================================================
         #  BUILD RETURN DICTIONARY
         # ==================================================================
@@ -123,23 +183,81 @@ class SteadyStateSolver:
             "notes": notes,
         }
 
-        log_solver_result(result)
+        if verbose:
+            log_solver_result(result)
         return result
 
+    # ------------------------------------------------------------------
+    #  INNER LINEAR SOLVERS
+    #  Each takes (A, b, nx, ny, head_prev, head_independent) and
+    #  returns (head, iterations, converged, notes)
+    # ------------------------------------------------------------------
+    def _solve_direct(self, A, b, nx, ny, head_prev, head_independent):
+        # The assembled conductance matrix is symmetric
+        if not head_independent:
+            # Head-dependent A differs on every outer pass: nothing to reuse
+            self._lu = factorize(A, symmetric=True)
+            self._lu_matrix = None
+        elif self._lu_matrix is None or self._matrix_changed(A):
+            self._lu = factorize(A, symmetric=True)
+            self._lu_matrix = (A.shape, A.indptr.copy(), A.indices.copy(), A.data.copy())
+
+        # Direct solver returns a full (nx, ny) head array
+        head = solve_direct(A, b, nx, ny, lu=self._lu)
+        return head, None, True, "Direct LU decomposition completed."
+
+    def _solve_sor(self, A, b, nx, ny, head_prev, head_independent):
+        # solve_iterative returns (head_2D, iterations, converged)
+        head, iterations, converged = solve_iterative(A, b, nx, ny)
+        return head, iterations, converged, "SOR iteration completed."
+
+    def _solve_cg(self, A, b, nx, ny, head_prev, head_independent):
+        # CG, warm-started from the previous outer iterate
+        head, iterations, converged = solve_cg(
+            A, b, nx, ny, x0=head_prev, preconditioner=self.preconditioner
+        )
+        return head, iterations, converged, (
+            f"CG ({self.preconditioner} preconditioner) completed."
+        )
+
+    def _matrix_changed(self, A):
+        """True if A differs from the matrix the cached LU was built from.
+
+        Used for head-independent systems only: a confined model solved
+        again with the same grid, properties and boundaries reproduces A
+        exactly, so the factorization from the previous solve still holds.
+        """
+        shape, indptr, indices, data = self._lu_matrix
+        return not (
+            A.shape == shape
+            and np.array_equal(A.indptr, indptr)
+            and np.array_equal(A.indices, indices)
+            and np.array_equal(A.data, data)
+        )
+
+    @staticmethod
+    def _residual(A, b, head):
+        """Residual norm for reporting.
+
+        Rows are ordered j*nx + i, i.e. Fortran order of the (nx, ny)
+        head array, which is a view rather than a copy.
+        """
+        r = A @ head.ravel(order="F")
+        r -= b  # in place: no second temporary
+        return np.linalg.norm(r)
+
     # ------------------------------------------------------------------
     #  INITIAL GUESS FOR HEAD FIELD
     # ------------------------------------------------------------------
     def _initial_head_guess(self, model, nx, ny):
         """Initialize head with average constant-head boundary or 10 ft."""
-        head = np.ones((nx, ny)) * 10.0
-
         ch_values = [
             bc["value"]
             for bc in model.boundaries
             if bc["type"] == "CONSTANT_HEAD"
         ]
 
-        if ch_values:
-            head[:] = sum(ch_values) / len(ch_values)
+        value = sum(ch_values) / len(ch_values) if ch_values else 10.0
 
-        return head
+        # One allocation, filled directly with the initial value
+        return np.full((nx, ny), value, dtype=float)
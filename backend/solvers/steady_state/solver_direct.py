@@ -1,22 +1,50 @@
 import numpy as np
-from scipy.sparse.linalg import spsolve
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
 
 
-def solve_direct(A, b, nx, ny):
+def factorize(A, symmetric=False):
     """
-    Solve the linear system A h = b using a direct sparse solver (spsolve).
+    Compute a sparse LU factorization (SuperLU) of A for repeated solves.
+
+    Parameters:
+        A : sparse CSR matrix
+        symmetric : if True, A is known to be symmetric; its CSR arrays are
+                    then used directly as the CSC matrix SuperLU expects
+                    (CSC of A == CSR of A^T == A), skipping the conversion
+
+    Returns:
+        SuperLU object (use .solve(b))
+    """
+    if symmetric:
+        A_csc = csc_matrix((A.data, A.indices, A.indptr), shape=A.shape)
+    else:
+        A_csc = A.tocsc()
+
+    # Minimum-degree ordering on A^T + A suits the symmetric 5-point stencil
+    return splu(A_csc, permc_spec="MMD_AT_PLUS_A")
+
+
+def solve_direct(A, b, nx, ny, lu=None):
+    """
+    Solve the linear system A h = b using a direct sparse LU factorization.
 
     Parameters:
         A : sparse CSR matrix
         b : RHS vector (length nx*ny)
         nx, ny : grid dimensions
+        lu : optional factorization of A from factorize(); if given it is
+             reused and only the triangular solves are performed
 
     Returns:
         head : 2D array (nx, ny)
     """
 
+    if lu is None:
+        lu = factorize(A)
+
     # Solve
-    h_flat = spsolve(A, b)
+    h_flat = lu.solve(b)
 
     # Reshape into (nx, ny)
     head = h_flat.reshape((ny, nx)).T
@@ -1,4 +1,6 @@
 import numpy as np
+from scipy.sparse import csc_matrix, diags, tril, triu
+from scipy.sparse.linalg import LinearOperator, cg, spilu, spsolve_triangular
 
 def solve_iterative(A, b, nx, ny, w=1.4, max_iter=3000, tol=1e-6, verbose=False):
     """
@@ -20,46 +22,44 @@ def solve_iterative(A, b, nx, ny, w=1.4, max_iter=3000, tol=1e-6, verbose=False)
     """
 
     N = nx * ny
-    A_data = A.data
-    A_indices = A.indices
-    A_indptr = A.indptr
 
-    # Initial guess for head
-    h = np.zeros(N)
-
-    # Gauss–Seidel / SOR iteration
-    for it in range(max_iter):
+    # Split A = D + L + U. One SOR sweep over the rows (in order) is the
+    # lower-triangular solve
+    #     (D + wL) h_new = w b - (wU + (w - 1) D) h_old
+    # which is done in compiled code instead of a Python loop over rows.
+    diag = A.diagonal()
+    skip = np.abs(diag) < 1e-20  # singular rows keep their value
+    skip_idx = np.flatnonzero(skip)  # usually empty: hoisted out of the sweeps
+    keep = diags((~skip).astype(float))
 
-        h_old = h.copy()
+    D = np.where(skip, 1.0, diag)
+    L = keep @ tril(A, k=-1, format="csr")
+    U = keep @ triu(A, k=1, format="csr")
 
-        # Loop over rows of the matrix
-        for row in range(N):
-            diag = None
-            sum_neighbors = 0.0
+    M = (diags(D) + w * L).tocsr()
+    R = (w * U + diags((w - 1.0) * D)).tocsr()
+    wb = w * b
 
-            start = A_indptr[row]
-            end = A_indptr[row + 1]
-
-            for idx in range(start, end):
-                col = A_indices[idx]
-                val = A_data[idx]
+    # Initial guess for head
+    h = np.zeros(N)
 
-                if col == row:
-                    diag = val
-                else:
-                    sum_neighbors += val * h[col]
+    # Work buffers reused by every sweep
+    rhs = np.empty(N)
+    delta = np.empty(N)
 
-            if diag is None or abs(diag) < 1e-20:
-                continue  # skip singular rows
+    # Gauss–Seidel / SOR iteration
+    for it in range(max_iter):
 
-            # Gauss–Seidel update (inner)
-            h_gs = (b[row] - sum_neighbors) / diag
+        h_old = h
 
-            # SOR update
-            h[row] = (1 - w) * h[row] + w * h_gs
+        np.subtract(wb, R @ h_old, out=rhs)
+        if skip_idx.size:
+            rhs[skip_idx] = h_old[skip_idx]
+        h = spsolve_triangular(M, rhs, lower=True)
 
         # Convergence check
-        residual = np.linalg.norm(h - h_old, ord=np.inf)
+        np.subtract(h, h_old, out=delta)
+        residual = np.abs(delta, out=delta).max()
         if verbose and (it % 100 == 0):
             print(f"Iter {it:4d}: Residual = {residual:.6e}")
 
@@ -68,3 +68,90 @@ def solve_iterative(A, b, nx, ny, w=1.4, max_iter=3000, tol=1e-6, verbose=False)
 
     # If reached here → did not converge
     return h.reshape((ny, nx)).T, max_iter, False
+
+
+def solve_cg(A, b, nx, ny, x0=None, tol=1e-8, max_iter=None, preconditioner="jacobi"):
+    """
+    Solve Ah = b using preconditioned conjugate gradients.
+
+    A must be symmetric positive definite, which holds for the assembled
+    conductance matrix (constant-head columns are moved to the RHS).
+
+    Parameters:
+        A : sparse CSR matrix
+        b : RHS vector (flattened, length = nx*ny)
+        nx, ny : grid dimensions
+        x0 : optional initial head, 2D array (nx, ny), used as warm start
+        tol : relative tolerance on the residual norm
+        max_iter : maximum CG iterations (scipy default if None)
+        preconditioner : "jacobi" (diagonal scaling, cheap) or "ilu"
+                         (symmetric incomplete factorization L D L^T, for
+                         ill-conditioned problems such as strongly
+                         heterogeneous K)
+
+    Returns:
+        head : 2D array (nx, ny)
+        iters : number of iterations performed
+        converged : bool
+    """
+    M = _preconditioner(A, preconditioner)
+
+    if x0 is not None:
+        x0 = x0.ravel(order="F")  # rows are ordered j*nx + i
+
+    iters = 0
+
+    def _count(_):
+        nonlocal iters
+        iters += 1
+
+    h, info = cg(A, b, x0=x0, rtol=tol, maxiter=max_iter, M=M, callback=_count)
+
+    return h.reshape((ny, nx)).T, iters, info == 0
+
+
+def _preconditioner(A, kind):
+    """Build the CG preconditioner M (an approximation of A^-1)."""
+    if kind == "jacobi":
+        # Diagonal scaling (guard against empty rows)
+        diag = A.diagonal()
+        diag[diag == 0.0] = 1.0
+        return diags(1.0 / diag)
+
+    if kind == "ilu":
+        # A is symmetric, so its CSR arrays are already its CSC form. With a
+        # symmetric ordering and no pivoting, rows and columns are permuted
+        # alike: P A P^T ~= L U.
+        A_csc = csc_matrix((A.data, A.indices, A.indptr), shape=A.shape)
+        ilu = spilu(
+            A_csc, drop_tol=1e-4, fill_factor=10,
+            permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+        )
+        return _symmetric_ilu(ilu)
+
+    raise ValueError(f"Unknown preconditioner: {kind}")
+
+
+def _symmetric_ilu(ilu):
+    """
+    SPD preconditioner L D L^T from an unpivoted incomplete LU.
+
+    Threshold dropping treats the L and U factors differently, so L U itself
+    is not symmetric and breaks CG's assumptions. Keeping only L and the
+    pivots D = diag(U) gives the symmetric approximation P A P^T ~= L D L^T.
+    """
+    perm = ilu.perm_c
+    L = ilu.L.tocsr()
+    Lt = ilu.L.T.tocsr()
+    inv_d = 1.0 / ilu.U.diagonal()
+
+    def apply(x):
+        y = np.empty_like(x)
+        y[perm] = x
+        y = spsolve_triangular(L, y, lower=True, unit_diagonal=True)
+        y *= inv_d
+        y = spsolve_triangular(Lt, y, lower=False, unit_diagonal=True)
+        return y[perm]
+
+    n = len(perm)
+    return LinearOperator((n, n), matvec=apply, dtype=float)
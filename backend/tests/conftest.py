@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from backend.core.aquifer_model import AquiferModel
+from backend.core.grid import Grid
+from backend.core.properties import AquiferProperties
+from backend.core.well import Well
+from backend.solvers.steady_state.interface import SteadyStateSolver
+
+
+@pytest.fixture(scope="session")
+def steady_solver():
+    """
+    One SteadyStateSolver for the whole session, so tests that solve the
+    same grid reuse its cached LU factorization and constant-head plan.
+    """
+    return SteadyStateSolver()
+
+
+@pytest.fixture
+def confined_model():
+    """5x5 confined aquifer: heads 100 (left) / 90 (right), one pumping well."""
+    return build_model(confined=True)
+
+
+@pytest.fixture
+def unconfined_model():
+    """Same layout as confined_model, but unconfined."""
+    return build_model(confined=False)
+
+
+def build_model(confined):
+    dx = np.full(5, 10.0)
+    dy = np.full(5, 10.0)
+    grid = Grid(dx=dx, dy=dy, nlay=1)
+
+    shape = (1, grid.nx, grid.ny)
+    props = AquiferProperties(
+        Kx=np.full(shape, 10.0),
+        Ky=np.full(shape, 10.0),
+        Kz=np.full(shape, 1.0),
+        thickness=np.array([20.0]),
+        Sy=np.array([0.20]),
+        Ss=np.array([1e-5]),
+        confined=confined,
+    )
+
+    model = AquiferModel(
+        name="Test Aquifer",
+        grid=grid,
+        properties=props,
+        boundaries=[
+            {"type": "CONSTANT_HEAD", "value": 100.0, "location": "LEFT"},
+            {"type": "CONSTANT_HEAD", "value": 90.0, "location": "RIGHT"},
+        ],
+    )
+
+    well = Well(name="PW-1", x=grid.x_centers[2], y=grid.y_centers[2], rate=-50.0)
+    well.assign_to_grid(grid)
+    model.wells.append(well)
+
+    return model
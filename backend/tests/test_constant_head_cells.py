@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.solvers.steady_state.assemble_matrix import constant_head_cells
+
+
+def make_model(*boundaries, nx=4, ny=4):
+    """Bare stand-in exposing only what constant_head_cells reads."""
+    return SimpleNamespace(
+        grid=SimpleNamespace(nx=nx, ny=ny),
+        boundaries=[{"type": "CONSTANT_HEAD", "value": 50.0, **bc} for bc in boundaries],
+    )
+
+
+@pytest.mark.parametrize(
+    "cell",
+    [
+        {"i": 0, "j": 4},    # past the last row
+        {"i": 4, "j": 1},    # past the last column (would alias cell (0, 2))
+        {"i": -1, "j": 0},   # negative (would wrap to the end)
+        {"i": 0, "j": -1},
+    ],
+)
+def test_out_of_grid_cell_is_ignored(cell):
+    rows, values = constant_head_cells(make_model(cell))
+
+    assert rows.size == 0
+    assert values.size == 0
+
+
+def test_out_of_grid_entries_dropped_from_arrays():
+    model = make_model(
+        {"i": np.array([0, 4, -1, 3]), "j": np.array([1, 1, 2, 3])},
+        {"cells": [(1, 0), (1, 4), (5, 5)]},
+    )
+
+    rows, values = constant_head_cells(model)
+
+    np.testing.assert_array_equal(rows, [1, 1 * 4 + 0, 3 * 4 + 3])
+    np.testing.assert_allclose(values, 50.0)
+
+
+def test_in_grid_cells_kept_alongside_bad_ones():
+    model = make_model({"i": 4, "j": 1}, {"i": 2, "j": 1})
+
+    rows, values = constant_head_cells(model)
+
+    np.testing.assert_array_equal(rows, [1 * 4 + 2])
+    np.testing.assert_allclose(values, [50.0])
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from backend.solvers.steady_state import interface
+from backend.solvers.steady_state.solver_direct import factorize
+
+
+@pytest.fixture
+def factorize_calls(monkeypatch):
+    """Record every LU factorization made by SteadyStateSolver."""
+    calls = []
+
+    def counting_factorize(A, **kwargs):
+        calls.append(A.shape)
+        return factorize(A, **kwargs)
+
+    monkeypatch.setattr(interface, "factorize", counting_factorize)
+    return calls
+
+
+def test_repeated_solve_reuses_factorization(steady_solver, confined_model, factorize_calls):
+    first = steady_solver.solve(confined_model, method="direct", verbose=False)
+    n_calls = len(factorize_calls)
+
+    second = steady_solver.solve(confined_model, method="direct", verbose=False)
+
+    assert len(factorize_calls) == n_calls
+    np.testing.assert_allclose(second["head"], first["head"])
+
+
+def test_changed_conductivity_refactors(steady_solver, confined_model, factorize_calls):
+    before = steady_solver.solve(confined_model, method="direct", verbose=False)
+    n_calls = len(factorize_calls)
+
+    confined_model.properties.Kx[0, 1, 2] *= 10.0
+    after = steady_solver.solve(confined_model, method="direct", verbose=False)
+
+    assert len(factorize_calls) == n_calls + 1
+    assert not np.allclose(after["head"], before["head"])
+
+
+def test_changed_boundaries_update_solution(steady_solver, confined_model):
+    steady_solver.solve(confined_model, method="direct", verbose=False)
+
+    confined_model.boundaries[1]["value"] = 80.0
+    result = steady_solver.solve(confined_model, method="direct", verbose=False)
+
+    np.testing.assert_allclose(result["head"][-1, :], 80.0)
+
+
+def test_switching_confinement_refactors(
+    steady_solver, confined_model, unconfined_model, factorize_calls
+):
+    first = steady_solver.solve(confined_model, method="direct", verbose=False)
+    n_calls = len(factorize_calls)
+
+    # Unconfined A changes every outer pass, so each pass factorizes anew
+    unconfined = steady_solver.solve(unconfined_model, method="direct", verbose=False)
+    assert unconfined["converged"]
+    assert len(factorize_calls) > n_calls
+    n_calls = len(factorize_calls)
+
+    # The confined LU was replaced meanwhile: it must be rebuilt, not reused
+    again = steady_solver.solve(confined_model, method="direct", verbose=False)
+    assert len(factorize_calls) == n_calls + 1
+    np.testing.assert_allclose(again["head"], first["head"])
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+from backend.core.aquifer_model import AquiferModel
+from backend.core.grid import Grid
+from backend.core.properties import AquiferProperties
+from backend.core.well import Well
+from backend.solvers.steady_state.assemble_matrix import assemble_matrix
+from backend.solvers.steady_state.interface import SteadyStateSolver
+from backend.solvers.steady_state.solver_iterative import _preconditioner
+
+METHODS = ["direct", "sor", "cg"]
+MODELS = ["confined_model", "unconfined_model"]
+
+
+@pytest.mark.parametrize("model_name", MODELS)
+@pytest.mark.parametrize("method", METHODS)
+def test_solve_steady_state(request, model_name, method):
+    model = request.getfixturevalue(model_name)
+
+    result = model.solve_steady_state(method=method, verbose=False)
+    head = result["head"]
+
+    assert result["converged"]
+    assert result["method"] == method
+    assert head.shape == (model.grid.nx, model.grid.ny)
+
+    # Total inner iterations (none for the direct method)
+    if method == "direct":
+        assert result["iterations"] is None
+    else:
+        assert result["iterations"] > 0
+
+    # Constant-head edges are held exactly
+    np.testing.assert_allclose(head[0, :], 100.0)
+    np.testing.assert_allclose(head[-1, :], 90.0)
+
+    # Drawdown at the pumping well
+    assert head[2, 2] < head[1, 2] < 100.0
+
+
+@pytest.mark.parametrize("model_name", MODELS)
+@pytest.mark.parametrize("method", ["sor", "cg"])
+def test_iterative_matches_direct(steady_solver, request, model_name, method):
+    model = request.getfixturevalue(model_name)
+
+    direct = steady_solver.solve(model, method="direct", verbose=False)
+    result = steady_solver.solve(model, method=method, verbose=False)
+
+    np.testing.assert_allclose(result["head"], direct["head"], atol=1e-3)
+
+
+@pytest.mark.parametrize("model_name", MODELS)
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ilu"])
+def test_cg_preconditioners_match_direct(steady_solver, request, model_name, preconditioner):
+    model = request.getfixturevalue(model_name)
+
+    direct = steady_solver.solve(model, method="direct", verbose=False)
+    result = SteadyStateSolver(preconditioner=preconditioner).solve(
+        model, method="cg", verbose=False
+    )
+
+    assert result["converged"]
+    assert preconditioner in result["notes"]
+    np.testing.assert_allclose(result["head"], direct["head"], atol=1e-3)
+
+
+def test_unknown_preconditioner_rejected(confined_model):
+    with pytest.raises(ValueError, match="preconditioner"):
+        SteadyStateSolver(preconditioner="amg").solve(
+            confined_model, method="cg", verbose=False
+        )
+
+
+def build_strip_model(well_rates):
+    """7x2 confined strip: heads 100 (left) / 90 (top), wells in cell (3, 1)."""
+    grid = Grid(dx=np.full(7, 10.0), dy=np.full(2, 10.0), nlay=1)
+
+    shape = (1, grid.nx, grid.ny)
+    props = AquiferProperties(
+        Kx=np.full(shape, 10.0),
+        Ky=np.full(shape, 10.0),
+        Kz=np.full(shape, 1.0),
+        thickness=np.array([20.0]),
+        Sy=np.array([0.20]),
+        Ss=np.array([1e-5]),
+        confined=True,
+    )
+
+    model = AquiferModel(
+        name="Strip",
+        grid=grid,
+        properties=props,
+        boundaries=[
+            {"type": "CONSTANT_HEAD", "value": 100.0, "location": "LEFT"},
+            {"type": "CONSTANT_HEAD", "value": 90.0, "location": "TOP"},
+        ],
+    )
+
+    for k, rate in enumerate(well_rates):
+        well = Well(name=f"PW-{k}", x=grid.x_centers[3], y=grid.y_centers[1], rate=rate)
+        well.assign_to_grid(grid)
+        model.wells.append(well)
+
+    return model
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_well_in_constant_head_cell_keeps_head(method):
+    # Cell (3, 1) lies on the TOP boundary: its head stays 90 and the
+    # wells there leave the rest of the field unchanged
+    with_wells = build_strip_model([-30.0, -30.0]).solve_steady_state(
+        method=method, verbose=False
+    )
+    without = build_strip_model([]).solve_steady_state(method=method, verbose=False)
+
+    assert with_wells["head"][3, 1] == pytest.approx(90.0)
+    np.testing.assert_allclose(with_wells["head"], without["head"], atol=1e-6)
+
+
+def build_heterogeneous_model(confined, n=40, seed=0):
+    """n x n aquifer with K spanning four orders of magnitude."""
+    rng = np.random.default_rng(seed)
+    grid = Grid(dx=np.full(n, 10.0), dy=np.full(n, 10.0), nlay=1)
+
+    K = 10.0 ** rng.uniform(-2.0, 2.0, size=(1, n, n))
+    props = AquiferProperties(
+        Kx=K,
+        Ky=K.copy(),
+        Kz=np.full(K.shape, 1.0),
+        thickness=np.array([20.0]),
+        Sy=np.array([0.20]),
+        Ss=np.array([1e-5]),
+        confined=confined,
+    )
+
+    return AquiferModel(
+        name="Heterogeneous",
+        grid=grid,
+        properties=props,
+        boundaries=[
+            {"type": "CONSTANT_HEAD", "value": 100.0, "location": "LEFT"},
+            {"type": "CONSTANT_HEAD", "value": 90.0, "location": "RIGHT"},
+        ],
+    )
+
+
+@pytest.mark.parametrize("confined", [True, False])
+def test_ilu_cg_on_heterogeneous_grid(confined):
+    model = build_heterogeneous_model(confined)
+
+    direct = SteadyStateSolver().solve(model, method="direct", verbose=False)
+    jacobi = SteadyStateSolver(preconditioner="jacobi").solve(
+        model, method="cg", verbose=False
+    )
+    ilu = SteadyStateSolver(preconditioner="ilu").solve(model, method="cg", verbose=False)
+
+    assert ilu["converged"]
+    np.testing.assert_allclose(ilu["head"], direct["head"], atol=1e-3)
+
+    # Strong K contrasts are where the incomplete factorization pays off
+    assert ilu["iterations"] * 10 < jacobi["iterations"]
+
+
+def test_ilu_preconditioner_is_symmetric_positive_definite():
+    model = build_heterogeneous_model(confined=True)
+    A, _, _ = assemble_matrix(model, np.full((model.grid.nx, model.grid.ny), 95.0))
+
+    M = _preconditioner(A, "ilu")
+
+    rng = np.random.default_rng(1)
+    x, y = rng.standard_normal((2, A.shape[0]))
+    assert x @ M.matvec(y) == pytest.approx(y @ M.matvec(x), rel=1e-10)
+    assert x @ M.matvec(x) > 0.0
@@ -3,7 +3,7 @@ import numpy as np
 from backend.core.grid import Grid
 from backend.core.properties import AquiferProperties
 from backend.core.well import Well
-from backend.solvers.steady_state.interface import solve_steady_state
+from backend.solvers.steady_state.interface import SteadyStateSolver
 
 
 def build_test_model():
@@ -85,36 +85,29 @@ def build_test_model():
 
 def run_test():
     model = build_test_model()
-    grid = model.grid
+    solver = SteadyStateSolver()
 
     print("\n=== STEADY-STATE GROUNDWATER SOLVER TEST ===")
 
     # --------------------------------------------------------
     # DIRECT SOLVER
     # --------------------------------------------------------
-    h_direct, outer1, info1, ok1 = solve_steady_state(
-        model,
-        method="direct",
-        verbose=False
-    )
+    direct = solver.solve(model, method="direct", verbose=False)
+    h_direct = direct["head"]
 
-    print("\n[Direct Solver] Converged:", ok1)
-    print("[Direct Solver] Outer iterations:", outer1)
+    print("\n[Direct Solver] Converged:", direct["converged"])
+    print("[Direct Solver] Notes:", direct["notes"])
     print("[Direct Solver] Head field:\n", h_direct)
 
     # --------------------------------------------------------
     # SOR ITERATIVE SOLVER
     # --------------------------------------------------------
-    h_sor, outer2, info2, ok2 = solve_steady_state(
-        model,
-        method="sor",
-        w=1.4,
-        verbose=False
-    )
+    sor = solver.solve(model, method="sor", verbose=False)
+    h_sor = sor["head"]
 
-    print("\n[SOR Solver] Converged:", ok2)
-    print("[SOR Solver] Outer iterations:", outer2)
-    print("[SOR Solver] SOR inner iterations:", info2["iters"])
+    print("\n[SOR Solver] Converged:", sor["converged"])
+    print("[SOR Solver] SOR inner iterations:", sor["iterations"])
+    print("[SOR Solver] Residual norm:", sor["residual_norm"])
     print("[SOR Solver] Head field:\n", h_sor)
 
     # --------------------------------------------------------
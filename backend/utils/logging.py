@@ -29,11 +29,15 @@ def log_solver_result(result: dict):
     method = result.get("method")
     notes = result.get("notes", "")
 
-    print(f"{_ts()} [SOLVER RESULT] Method: {method}")
-    print(f"{_ts()}   Converged:      {converged}")
-    print(f"{_ts()}   Iterations:     {iterations}")
-    print(f"{_ts()}   Residual Norm:  {residual:.3e}")
-    print(f"{_ts()}   Notes:          {notes}")
+    # One timestamp for the whole block, written with a single print call
+    ts = _ts()
+    print(
+        f"{ts} [SOLVER RESULT] Method: {method}\n"
+        f"{ts}   Converged:      {converged}\n"
+        f"{ts}   Iterations:     {iterations}\n"
+        f"{ts}   Residual Norm:  {residual:.3e}\n"
+        f"{ts}   Notes:          {notes}"
+    )
 
 
 # ---------------------------------------------------------